@@ -1,17 +1,17 @@
 import streamlit as st
 from main import run_copy_operations
-import pandas as pd
+from modules.verify_module import REPORT_FILE_PATH
 from modules.hompage_id_module import (
     read_csv, write_csv, update_env_file, get_child_page_ids_and_titles, append_to_csv,
     read_homepages, write_homepages, add_homepage, remove_homepage, get_page_title
 )
+from modules.csv_store import homepages_store
+from modules.config import ENV_FILE_PATH, get_settings, reload_settings
 import os
-from dotenv import load_dotenv
 
-# Define the path to your CSV files and .env file
+# Define the path to your CSV files
 CSV_FILE_PATH = "data/copy_operations.csv"
 HOMEPAGES_FILE_PATH = "data/homepages.csv"
-ENV_FILE_PATH = ".env"
 
 # Initialize variables
 username, api_token, base_url = None, None, None
@@ -22,10 +22,8 @@ st.title("Confluence Page Copy Tool")
 # Check if the .env file exists
 if os.path.exists(ENV_FILE_PATH):
     # Load the environment variables
-    load_dotenv(ENV_FILE_PATH)
-    username = os.getenv("USERNAME")
-    api_token = os.getenv("API_TOKEN")
-    base_url = os.getenv("BASE_URL")
+    settings = get_settings()
+    username, api_token, base_url = settings.username, settings.api_token, settings.base_url
     
     if not username or not api_token or not base_url:
         st.warning("Some environment variables are not set. Please enter your credentials to continue.")
@@ -48,23 +46,21 @@ with st.sidebar:
         update_env_file(ENV_FILE_PATH, "BASE_URL", base_url)
         
         # Reload the environment variables after saving
-        load_dotenv(ENV_FILE_PATH)
+        settings = reload_settings()
         
         # Update local variables after reloading .env
-        username = os.getenv("USERNAME")
-        api_token = os.getenv("API_TOKEN")
-        base_url = os.getenv("BASE_URL")
+        username, api_token, base_url = settings.username, settings.api_token, settings.base_url
         
         st.success("Environment variables saved to .env file.")
 
 # Only proceed if all environment variables are set
 if username and api_token and base_url:
     # Load the homepage IDs from homepages.csv
-    homepages_df = pd.read_csv(HOMEPAGES_FILE_PATH)
-    homepages = [(row['homepage_id'], get_page_title(row['homepage_id'])) for _, row in homepages_df.iterrows()]
+    homepage_store = homepages_store(HOMEPAGES_FILE_PATH)
+    homepages = [(homepage_id, get_page_title(homepage_id)) for homepage_id in homepage_store.keys()]
 
     # Filter out protected homepage IDs for the 'to' column dropdown
-    unprotected_homepages = [(row['homepage_id'], get_page_title(row['homepage_id'])) for _, row in homepages_df.iterrows() if not row.get('protected', 'true')]
+    unprotected_homepages = [hp for hp in homepages if not homepage_store.is_protected(hp[0])]
 
     # Get all child pages for all homepage IDs
     all_child_pages = []
@@ -103,8 +99,13 @@ if username and api_token and base_url:
         # Add a button to trigger the copy operations
         if st.button("Copy to Confluence"):
             with st.spinner("Running copy operations..."):
-                run_copy_operations()
-            st.success("Copy operations completed successfully!")    
+                reports = run_copy_operations()
+            failed = [report for report in reports if not report["ok"]]
+            if failed:
+                st.error(f"{len(failed)} of {len(reports)} copy operations did not verify. See {REPORT_FILE_PATH} for details.")
+                st.dataframe([{"from": r["from"], "to": r["to"], "issues": r.get("error") or f"{len(r['differences'])} differences"} for r in failed])
+            else:
+                st.success("Copy operations completed successfully!")    
 
         st.header("Add Page IDs from Confluence")
 
@@ -145,11 +146,11 @@ if username and api_token and base_url:
     with tab2:
         st.header("Manage Homepage IDs")
 
-        # Load homepages data
-        homepages_df = pd.read_csv(HOMEPAGES_FILE_PATH)
+        # Load homepages data (all columns are read as strings)
+        homepages_df = read_csv(HOMEPAGES_FILE_PATH)
 
-        # Ensure homepage_id is treated as a string to avoid dtype conflicts
-        homepages_df['homepage_id'] = homepages_df['homepage_id'].astype(str)
+        # Show the protected flag as a checkbox in the editor
+        homepages_df['protected'] = homepages_df['protected'].str.lower() == 'true'
 
         # Add a column to display the homepage title
         homepages_df['homepage_title'] = homepages_df['homepage_id'].apply(get_page_title)
@@ -193,21 +194,14 @@ if username and api_token and base_url:
 
         if st.button("Add Homepage ID"):
             if new_homepage_id:
-                if new_homepage_id in homepages_df['homepage_id'].values:
+                if new_homepage_id in homepage_store:
                     st.error(f"Homepage ID {new_homepage_id} already exists.")
                 else:
-                    new_entry = pd.DataFrame([{'homepage_id': new_homepage_id, 'protected': new_protected_status}])
-
-                    # Use pd.concat to add the new row to the DataFrame
-                    homepages_df = pd.concat([homepages_df, new_entry], ignore_index=True)
-
-                    # Write the updated DataFrame to the CSV file and update the displayed table
-                    write_csv(HOMEPAGES_FILE_PATH, homepages_df[['homepage_id', 'protected']])
+                    # Appends a single row to the CSV rather than rewriting the whole file
+                    add_homepage(HOMEPAGES_FILE_PATH, new_homepage_id, new_protected_status)
                     st.success(f"Added new homepage ID {new_homepage_id} with protection status set to {new_protected_status}.")
 
                     # Refresh the table after adding
-                    display_df = homepages_df[['homepage_title', 'homepage_id', 'protected']]
-                    display_df['homepage_id'] = display_df['homepage_id'].astype(str)
                     st.rerun()
             else:
                 st.error("Please enter a valid homepage ID.")
@@ -0,0 +1,95 @@
+"""Cold-start benchmark for the command-line entry points.
+
+Imports each entry point module in a fresh interpreter with
+``python -X importtime -c "import <module>"`` and reports the cumulative import
+time of the module together with the wall-clock time of the whole process.
+
+The entry points only start talking to Confluence under their
+``if __name__ == "__main__"`` guards, so importing the module runs everything
+`python main.py` or `python -m modules.copy_module` does before real work
+begins, without needing credentials or network access. The process time is
+therefore the cold start of that entry point, minus the work itself. Usage:
+
+    python benchmarks/startup.py [--runs N] [--budget SECONDS]
+
+The script exits with a non-zero status if any entry point's median process time
+exceeds the budget, so it can be wired into CI or a cron health check.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Module names imported by `python main.py`, `python modules/<name>.py`, ...
+ENTRY_POINTS = [
+    "main",
+    "modules.copy_module",
+    "modules.delete_module",
+    "modules.hompage_id_module",
+    "modules.retrieve",
+    "modules.verify_module",
+]
+
+def parse_import_time(stderr, module):
+    """Return the cumulative import time of `module` in seconds from -X importtime output."""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|", 2)
+        # Nested imports are indented; the top-level entry has exactly one leading space
+        if name.strip() == module and not name[1:].startswith(" "):
+            return int(cumulative) / 1_000_000
+    return None
+
+def measure(module):
+    """Import `module` once in a fresh interpreter, returning (wall, import) times in seconds."""
+    start = perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    wall = perf_counter() - start
+    if result.returncode != 0:
+        # Drop the -X importtime lines so the traceback is what gets reported
+        error = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Importing {module} failed with exit code {result.returncode}" + (":\n" + "\n".join(error) if error else "."))
+    return wall, parse_import_time(result.stderr, module)
+
+def run_benchmark(modules, runs):
+    results = {}
+    for module in modules:
+        samples = [measure(module) for _ in range(runs)]
+        import_times = [imp for _, imp in samples if imp is not None]
+        results[module] = (
+            statistics.median(wall for wall, _ in samples),
+            statistics.median(import_times) if import_times else float("nan")
+        )
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts per entry point.")
+    parser.add_argument("--budget", type=float, default=1.0, help="Maximum median process time in seconds.")
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS, help="Entry point modules to measure.")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.modules, args.runs)
+
+    print(f"{'entry point':<30} {'process (s)':>12} {'import time (s)':>16}")
+    over_budget = []
+    for module, (wall, imp) in results.items():
+        print(f"{module:<30} {wall:>12.3f} {imp:>16.3f}")
+        if wall > args.budget:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"Over the {args.budget:.2f}s budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,16 @@
-import csv
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
 from time import sleep
 from modules.log_utils import log_function_call, logger
-from dotenv import load_dotenv
 from modules.delete_module import delete_pages_from_csv
 from modules.copy_module import copy_page  # Assuming you have a function named `copy_page` in `copy_module.py`
-import os
-
-# Load environment variables from the .env file
-load_dotenv()
+from modules.csv_store import operations_store
+from modules.verify_module import verify_operations, write_report
 
 @log_function_call
 def read_csv_to_dict(file_path):
-    with open(file_path, mode='r') as file:
-        return list(csv.DictReader(file))
+    # Read through the store so edits made from the app while a run is in progress are never seen half-written
+    return operations_store(file_path).rows()
 
 @log_function_call
 def deduplicate_operations(operations):
@@ -37,7 +34,8 @@ def run_copy_process(source_page_id, destination_page_id, prefix_title):
         logger.error(f"Error copying from {source_page_id} to {destination_page_id} with prefix '{prefix_title}': {e}")
         return 1, [], [str(e)]
 
-def run_copy_operations():
+def run_copy_operations(verify=True):
+    """Run every operation in the CSV and return the verification reports (empty if `verify` is False)."""
     file_path = "data/copy_operations.csv"
     homepages_csv_file = "data/homepages.csv"
     
@@ -67,5 +65,18 @@ def run_copy_operations():
 
     logger.info("Finished executing all copy operations from the CSV.")
 
+    # Step 2: Check that each destination tree actually matches its source
+    if not verify:
+        return []
+    reports = verify_operations(deduplicated_operations_list)
+    write_report(reports)
+    failed = [report for report in reports if not report["ok"]]
+    if failed:
+        logger.warning(f"{len(failed)} of {len(reports)} copy operations did not verify. See the verification report for details.")
+    else:
+        logger.info("All copy operations verified successfully.")
+    return reports
+
 if __name__ == "__main__":
-    run_copy_operations()
+    reports = run_copy_operations(verify="--no-verify" not in sys.argv)
+    sys.exit(0 if all(report["ok"] for report in reports) else 1)
@@ -0,0 +1,50 @@
+import functools
+import os
+from dataclasses import dataclass
+
+ENV_FILE_PATH = ".env"
+
+@dataclass(frozen=True)
+class Settings:
+    username: str
+    api_token: str
+    base_url: str
+
+    @property
+    def api_base_url(self):
+        return f"{self.base_url}/wiki/rest/api/content"
+
+    @property
+    def is_complete(self):
+        return bool(self.username and self.api_token and self.base_url)
+
+    def require(self):
+        """Raise if any of the Confluence credentials are missing."""
+        if not self.is_complete:
+            raise ValueError("Missing required environment variables. Please ensure USERNAME, API_TOKEN, and BASE_URL are set in the .env file.")
+        return self
+
+def _load_env_file(env_file, override=False):
+    # Imported here so that modules which never touch credentials don't pay for it
+    from dotenv import find_dotenv, load_dotenv
+
+    # Fall back to searching upwards from the project, as a bare load_dotenv() would
+    path = env_file if os.path.exists(env_file) else find_dotenv()
+    if path:
+        load_dotenv(path, override=override)
+
+@functools.lru_cache(maxsize=None)
+def get_settings():
+    """Load the .env file once and return the cached Confluence settings."""
+    _load_env_file(ENV_FILE_PATH)
+    return Settings(
+        username=os.getenv('USERNAME'),
+        api_token=os.getenv('API_TOKEN'),
+        base_url=os.getenv('BASE_URL')
+    )
+
+def reload_settings():
+    """Re-read the .env file (overriding the current environment) and refresh the cached settings."""
+    _load_env_file(ENV_FILE_PATH, override=True)
+    get_settings.cache_clear()
+    return get_settings()
@@ -1,20 +1,12 @@
-import requests
 import json
 import sys
 from time import sleep
-from dotenv import load_dotenv
-import os
+from modules.config import get_settings
 from modules.log_utils import logger  # Adjusted import path
 
-# Load environment variables from .env file
-load_dotenv()
-
-USERNAME = os.getenv('USERNAME')
-API_TOKEN = os.getenv('API_TOKEN')
-BASE_URL = os.getenv('BASE_URL')
-api_base_url = f"{BASE_URL}/wiki/rest/api/content"
-
 def check_task_status(task_url, headers, auth):
+    import requests
+
     for _ in range(3):
         response = requests.get(task_url, headers=headers, auth=auth, timeout=30)
         if response.status_code == 200:
@@ -33,10 +25,14 @@ def check_task_status(task_url, headers, auth):
     return False
 
 def copy_page(source_page_id, destination_page_id, prefix_title, retries=3):
+    import requests
+
+    settings = get_settings()
     headers = {
         "Content-Type": "application/json",
-        "Authorization": f"Bearer {API_TOKEN}"
+        "Authorization": f"Bearer {settings.api_token}"
     }
+    auth = (settings.username, settings.api_token)
 
     payload = {
         "copyAttachments": True,
@@ -49,8 +45,8 @@ def copy_page(source_page_id, destination_page_id, prefix_title, retries=3):
 
     for attempt in range(retries):
         logger.debug(f"Attempt {attempt + 1} to copy page {source_page_id} to {destination_page_id} with prefix '{prefix_title}'")
-        response = requests.post(f"{api_base_url}/{source_page_id}/pagehierarchy/copy",
-                                 headers=headers, auth=(USERNAME, API_TOKEN),
+        response = requests.post(f"{settings.api_base_url}/{source_page_id}/pagehierarchy/copy",
+                                 headers=headers, auth=auth,
                                  data=json.dumps(payload), timeout=60)
 
         logger.debug(f"Response status code: {response.status_code}")
@@ -59,8 +55,8 @@ def copy_page(source_page_id, destination_page_id, prefix_title, retries=3):
         if response.status_code in [200, 202]:
             if response.status_code == 202:
                 try:
-                    task_url = f"{BASE_URL}{response.json()['links']['status']}"
-                    if check_task_status(task_url, headers, (USERNAME, API_TOKEN)):
+                    task_url = f"{settings.base_url}{response.json()['links']['status']}"
+                    if check_task_status(task_url, headers, auth):
                         logger.info(f"Successfully copied page {source_page_id} to {destination_page_id} with prefix '{prefix_title}'")
                         return 0
                 except (requests.exceptions.JSONDecodeError, ValueError):
@@ -0,0 +1,274 @@
+import csv
+import io
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+OPERATIONS_FIELDS = ["from", "to", "prefix"]
+HOMEPAGES_FIELDS = ["homepage_id", "protected"]
+
+class CsvStore:
+    """A small CSV-backed table with locking, atomic rewrites and an in-memory index.
+
+    Rows are kept as dicts of strings and the file is always read and written as
+    UTF-8. Readers take a shared lock and writers an exclusive one on a sidecar
+    `<file>.lock`, so a copy run reading the file never sees a half-written edit.
+    Appends only write the new row; every other change is written to a temporary
+    file and renamed over the original.
+    """
+
+    def __init__(self, file_path, fieldnames=None, key=None):
+        self.file_path = file_path
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.key = key
+        self._rows = []
+        self._index = {}
+        self._signature = None
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_exclusive = False
+
+    # Locking
+
+    @contextmanager
+    def locked(self, exclusive=False):
+        """Hold the cross-process lock on the file for the duration of the block.
+
+        The lock is re-entrant for the thread holding it, so store methods can be
+        called inside the block. A shared lock cannot be upgraded to an exclusive one.
+        """
+        with self._thread_lock:
+            if self._lock_depth:
+                # Already held by this thread: flock locks belong to the open file, so don't lock again
+                if exclusive and not self._lock_exclusive:
+                    raise RuntimeError(f"Cannot take an exclusive lock on {self.file_path} while holding a shared one.")
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            lock_file = open(f"{self.file_path}.lock", "a+b")
+            try:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                else:
+                    # msvcrt has no shared locks, so every access is exclusive on Windows
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            except BaseException:
+                lock_file.close()
+                raise
+
+            self._lock_depth, self._lock_exclusive = 1, exclusive
+            try:
+                yield
+            finally:
+                self._lock_depth, self._lock_exclusive = 0, False
+                try:
+                    if fcntl:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+                    else:
+                        lock_file.seek(0)
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                finally:
+                    lock_file.close()
+
+    # Reading
+
+    def _row_key(self, row):
+        if isinstance(self.key, (tuple, list)):
+            return tuple(row.get(column, "") for column in self.key)
+        return row.get(self.key, "")
+
+    def _stat_signature(self):
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _load(self):
+        """Re-read the file if it changed on disk since it was last loaded. Caller holds the lock."""
+        signature = self._stat_signature()
+        if signature is not None and signature == self._signature:
+            return
+
+        rows = []
+        if signature is not None:
+            with open(self.file_path, mode="r", newline="", encoding="utf-8") as file:
+                reader = csv.DictReader(file)
+                if reader.fieldnames:
+                    self.fieldnames = reader.fieldnames
+                # Skip blank rows and normalise missing cells to empty strings
+                rows = [{k: v or "" for k, v in row.items() if k is not None}
+                        for row in reader if any(row.values())]
+        self._set_rows(rows)
+        self._signature = signature
+
+    def _set_rows(self, rows):
+        self._rows = rows
+        self._index = {self._row_key(row): row for row in rows} if self.key else {}
+
+    def rows(self):
+        """Return a copy of all rows."""
+        with self.locked():
+            self._load()
+            return [dict(row) for row in self._rows]
+
+    def keys(self):
+        """Return the keys of all rows, in file order."""
+        with self.locked():
+            self._load()
+            return list(self._index)
+
+    def get(self, key, default=None):
+        with self.locked():
+            self._load()
+            row = self._index.get(key)
+            return dict(row) if row is not None else default
+
+    def __contains__(self, key):
+        with self.locked():
+            self._load()
+            return key in self._index
+
+    # Writing
+
+    def _serialize(self, rows, header=False):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.fieldnames, extrasaction="ignore", lineterminator="\n")
+        if header:
+            writer.writeheader()
+        for row in rows:
+            writer.writerow({k: "" if v is None else str(v) for k, v in row.items()})
+        return buffer.getvalue()
+
+    def append(self, row):
+        """Append a single row without rewriting the rest of the file."""
+        with self.locked(exclusive=True):
+            self._load()
+            self._append(row)
+
+    def add(self, row):
+        """Append `row` unless a row with the same key exists. Returns True if it was added."""
+        with self.locked(exclusive=True):
+            self._load()
+            if self._row_key(self._normalize(row)) in self._index:
+                return False
+            self._append(row)
+            return True
+
+    def _normalize(self, row):
+        return {field: "" if row.get(field) is None else str(row.get(field)) for field in self.fieldnames or row}
+
+    def _append(self, row):
+        """Append `row` to the end of the file. Caller holds the lock and has loaded the file."""
+        if not self.fieldnames:
+            self.fieldnames = list(row)
+        if self._signature is None or os.path.getsize(self.file_path) == 0:
+            # Nothing to append to yet, so write the header along with the row
+            self._replace(self._rows + [row])
+            return
+
+        data = self._serialize([row])
+        with open(self.file_path, mode="rb") as file:
+            # The file may have been saved without a trailing newline
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) not in (b"\n", b"\r"):
+                data = "\n" + data
+        with open(self.file_path, mode="a", newline="", encoding="utf-8") as file:
+            file.write(data)
+
+        row = self._normalize(row)
+        self._rows.append(row)
+        if self.key:
+            self._index[self._row_key(row)] = row
+        self._signature = self._stat_signature()
+
+    def write(self, rows, fieldnames=None):
+        """Atomically replace the file contents with `rows`, optionally changing the columns."""
+        with self.locked(exclusive=True):
+            if fieldnames:
+                self.fieldnames = list(fieldnames)
+            self._replace(rows)
+
+    def _replace(self, rows):
+        """Write `rows` to a temporary file and rename it over the original. Caller holds the lock."""
+        rows = list(rows)
+        if not self.fieldnames and rows:
+            self.fieldnames = list(rows[0])
+
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".csv")
+        try:
+            with os.fdopen(fd, mode="w", newline="", encoding="utf-8") as file:
+                file.write(self._serialize(rows, header=True))
+                file.flush()
+                os.fsync(file.fileno())
+            if os.path.exists(self.file_path):
+                # mkstemp creates the file private to the owner; keep the original permissions
+                os.chmod(temp_path, os.stat(self.file_path).st_mode)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self._set_rows([self._normalize(row) for row in rows])
+        self._signature = self._stat_signature()
+
+    def remove(self, key):
+        """Remove every row with the given key. Returns True if anything was removed."""
+        with self.locked(exclusive=True):
+            self._load()
+            if key not in self._index:
+                return False
+            self._replace([row for row in self._rows if self._row_key(row) != key])
+            return True
+
+class HomepagesStore(CsvStore):
+    """The homepages table, indexed by homepage ID."""
+
+    def __init__(self, file_path):
+        super().__init__(file_path, HOMEPAGES_FIELDS, key="homepage_id")
+
+    def is_protected(self, homepage_id):
+        row = self.get(homepage_id)
+        return bool(row) and row.get("protected", "").lower() == "true"
+
+    def protected_ids(self):
+        with self.locked():
+            self._load()
+            return {key for key, row in self._index.items() if row.get("protected", "").lower() == "true"}
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def _get_store(store_class, file_path, *args):
+    # Share one instance per file so the in-memory index survives between calls
+    with _stores_lock:
+        cache_key = (store_class, os.path.abspath(file_path)) + args
+        if cache_key not in _stores:
+            _stores[cache_key] = store_class(file_path, *args)
+        return _stores[cache_key]
+
+def operations_store(file_path):
+    """Return the shared store for a copy operations CSV, indexed by (from, to)."""
+    return _get_store(CsvStore, file_path, tuple(OPERATIONS_FIELDS), ("from", "to"))
+
+def homepages_store(file_path):
+    """Return the shared store for a homepages CSV."""
+    return _get_store(HomepagesStore, file_path)
+
+def table_store(file_path):
+    """Return the shared store for an arbitrary CSV whose columns are taken from its header."""
+    return _get_store(CsvStore, file_path)
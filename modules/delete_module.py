@@ -1,48 +1,30 @@
-import csv
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dotenv import load_dotenv
-from atlassian import Confluence
-import os
 from time import sleep
-
-# Load environment variables
-load_dotenv()
+from modules.config import get_settings
+from modules.csv_store import homepages_store, operations_store
 
 def initialize_confluence():
-    USERNAME = os.getenv('USERNAME')
-    API_TOKEN = os.getenv('API_TOKEN')
-    BASE_URL = os.getenv('BASE_URL')
-
     # Check if the environment variables are set
-    if not USERNAME or not API_TOKEN or not BASE_URL:
-        raise ValueError("Missing required environment variables. Please ensure USERNAME, API_TOKEN, and BASE_URL are set in the .env file.")
+    settings = get_settings().require()
+
+    # atlassian pulls in requests and friends, so only import it once a client is needed
+    from atlassian import Confluence
 
     # Setup Confluence client
     return Confluence(
-        url=BASE_URL,
-        username=USERNAME,
-        password=API_TOKEN
+        url=settings.base_url,
+        username=settings.username,
+        password=settings.api_token
     )
 
 def fetch_unique_homepage_ids(csv_file):
     """Fetch and deduplicate homepage IDs from the 'to' column in the CSV."""
-    unique_homepage_ids = set()
-    with open(csv_file, mode='r') as file:
-        csv_reader = csv.DictReader(file)
-        for row in csv_reader:
-            homepage_id = row['to']
-            unique_homepage_ids.add(homepage_id)
+    unique_homepage_ids = {row['to'] for row in operations_store(csv_file).rows()}
     return list(unique_homepage_ids)
 
 def get_protected_homepage_ids(hompages_csv_file):
     """Fetch homepage IDs marked as protected from the homepages.csv."""
-    protected_homepage_ids = set()
-    with open(hompages_csv_file, mode='r') as file:
-        csv_reader = csv.DictReader(file)
-        for row in csv_reader:
-            if row.get('protected', '').lower() == 'true':
-                protected_homepage_ids.add(row['homepage_id'])
-    return protected_homepage_ids
+    return homepages_store(hompages_csv_file).protected_ids()
 
 def get_child_page_ids(confluence, homepage_id):
     """Fetch child page IDs from a given homepage ID."""
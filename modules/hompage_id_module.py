@@ -1,37 +1,33 @@
-import pandas as pd
-from atlassian import Confluence
-from dotenv import load_dotenv, set_key
-import os
-
-# Load existing .env variables
-load_dotenv()
+from modules.config import get_settings
+from modules.csv_store import homepages_store, operations_store, table_store
 
 def initialize_confluence():
     """Initialize and return a Confluence object."""
-    API_TOKEN = os.getenv('API_TOKEN')
-    BASE_URL = os.getenv('BASE_URL')
-    USERNAME = os.getenv('USERNAME')
-
     # Check if the environment variables are set
-    if not USERNAME or not API_TOKEN or not BASE_URL:
-        raise ValueError("Missing required environment variables. Please ensure USERNAME, API_TOKEN, and BASE_URL are set in the .env file.")
+    settings = get_settings().require()
+
+    from atlassian import Confluence
 
     # Initialize and return the Confluence object
     return Confluence(
-        url=BASE_URL,
-        username=USERNAME,
-        password=API_TOKEN
+        url=settings.base_url,
+        username=settings.username,
+        password=settings.api_token
     )
 
 def read_csv(file_path):
-    return pd.read_csv(file_path, dtype=str)  # Read as strings to prevent .0 issue
+    import pandas as pd
+    store = table_store(file_path)
+    rows = store.rows()  # Read under the store's lock so a concurrent write is never seen half-done
+    return pd.DataFrame(rows, columns=store.fieldnames, dtype=str)
 
 def write_csv(file_path, dataframe):
     dataframe.dropna(how='all', inplace=True)  # Remove rows where all values are None
     dataframe.fillna('', inplace=True)  # Replace NaN with empty strings
-    dataframe.to_csv(file_path, index=False)
+    table_store(file_path).write(dataframe.to_dict('records'), fieldnames=list(dataframe.columns))
 
 def update_env_file(env_file, key, value):
+    from dotenv import set_key
     set_key(env_file, key, value)
 
 def get_page_title(page_id):
@@ -52,52 +48,31 @@ def get_child_page_ids_and_titles(homepage_id):
         return f"An error occurred while fetching child pages for homepage {homepage_id}: {e}"
 
 def append_to_csv(file_path, from_id, to_id, prefix):
-    df = read_csv(file_path)
-    new_row = pd.DataFrame([[from_id, to_id, prefix]], columns=["from", "to", "prefix"])
-    updated_df = pd.concat([df, new_row], ignore_index=True)
-    write_csv(file_path, updated_df)
+    operations_store(file_path).append({"from": from_id, "to": to_id, "prefix": prefix})
 
 def read_homepages(file_path):
     """Read homepage IDs from a file into a list."""
-    if os.path.exists(file_path):
-        try:
-            data = pd.read_csv(file_path, dtype=str, header=None)
-            if data.empty:
-                return []  # Return an empty list if the file is empty
-            
-            # If data contains only one column, convert it to a list
-            if len(data.columns) == 1:
-                return data[0].tolist()
-            else:
-                raise ValueError("Homepage file should only have one column.")
-        except pd.errors.EmptyDataError:
-            return []  # Handle the case where the CSV is empty
-        except Exception as e:
-            return [f"An error occurred: {e}"]
-    else:
-        return []
+    return homepages_store(file_path).keys()
 
 def write_homepages(file_path, homepages):
-    """Write a list of homepage IDs to a file, ensuring uniqueness."""
-    unique_homepages = pd.Series(homepages).drop_duplicates().dropna().tolist()
-    pd.Series(unique_homepages).to_csv(file_path, index=False, header=False)
+    """Write a list of homepage IDs to a file, ensuring uniqueness and keeping their protected flags."""
+    store = homepages_store(file_path)
+    # Read and rewrite under one lock so a concurrent add or remove isn't lost
+    with store.locked(exclusive=True):
+        existing = {row['homepage_id']: row for row in store.rows()}
+        unique_homepages = [h for h in dict.fromkeys(homepages) if h]
+        store.write([existing.get(h, {'homepage_id': h, 'protected': 'False'}) for h in unique_homepages])
 
-def add_homepage(file_path, homepage_id):
+def add_homepage(file_path, homepage_id, protected=False):
     """Add a homepage ID to the list, ensuring no duplicates."""
-    homepages = read_homepages(file_path)
-    if homepage_id not in homepages:
-        homepages.append(homepage_id)
-        write_homepages(file_path, homepages)
+    if homepages_store(file_path).add({'homepage_id': homepage_id, 'protected': protected}):
         return f"Homepage ID {homepage_id} added."
     else:
         return f"Homepage ID {homepage_id} is already in the list."
 
 def remove_homepage(file_path, homepage_id):
     """Remove a homepage ID from the list."""
-    homepages = read_homepages(file_path)
-    if homepage_id in homepages:
-        homepages.remove(homepage_id)
-        write_homepages(file_path, homepages)
+    if homepages_store(file_path).remove(homepage_id):
         return f"Homepage ID {homepage_id} removed."
     else:
         return f"Homepage ID {homepage_id} not found in the list."
@@ -1,25 +1,20 @@
-import requests
-import os
-from dotenv import load_dotenv
+from modules.config import get_settings
 
-# Load environment variables from the .env file
-load_dotenv()
-
-# Confluence credentials and instance setup
-API_TOKEN = os.getenv('API_TOKEN')
-BASE_URL = os.getenv('BASE_URL')
-USERNAME = os.getenv('USERNAME')
+# Confluence instance setup
 SPACE_KEY = "Cognita"  # Replace with your space key
 
 # Headers for the API requests
-headers = {
-    "Authorization": f"Bearer {API_TOKEN}",
-    "Content-Type": "application/json"
-}
+def get_headers():
+    return {
+        "Authorization": f"Bearer {get_settings().api_token}",
+        "Content-Type": "application/json"
+    }
 
 def get_trashed_pages(space_key):
-    url = f"{BASE_URL}/wiki/rest/api/content?spaceKey={space_key}&status=trashed&limit=200"
-    response = requests.get(url, headers=headers)
+    import requests
+
+    url = f"{get_settings().base_url}/wiki/rest/api/content?spaceKey={space_key}&status=trashed&limit=200"
+    response = requests.get(url, headers=get_headers())
 
     if response.status_code == 200:
         return response.json().get('results', [])
@@ -33,9 +28,11 @@ def filter_pages(pages):
 
 # Step 3: Restore the Pages
 def restore_page(page_id):
-    url = f"{BASE_URL}/wiki/pages/dorestoretrashitem.action"
+    import requests
+
+    url = f"{get_settings().base_url}/wiki/pages/dorestoretrashitem.action"
     data = {"key": SPACE_KEY, "contentId": page_id}
-    response = requests.post(url, headers=headers, data=data)
+    response = requests.post(url, headers=get_headers(), data=data)
 
     if response.status_code == 200:
         print(f"Successfully restored page with ID: {page_id}")
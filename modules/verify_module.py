@@ -0,0 +1,222 @@
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import sleep
+from modules.config import get_settings
+from modules.log_utils import logger
+
+# Versions, labels and the first page of attachments come back with each child listing,
+# so every level of the tree costs one request per parent page rather than one per page.
+PAGE_EXPAND = "version,metadata.labels,children.attachment"
+PAGE_LIMIT = 200
+RETRY_DELAY = 5
+REPORT_FILE_PATH = "logs/verification_report.json"
+
+def create_session():
+    import requests  # Only needed once there is something to verify
+
+    settings = get_settings().require()
+    session = requests.Session()
+    session.auth = (settings.username, settings.api_token)
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {settings.api_token}"
+    })
+    return session
+
+def api_get(session, path, params=None, retries=3):
+    """GET a Confluence REST resource, backing off when rate limited."""
+    url = f"{get_settings().api_base_url}{path}"
+    for attempt in range(retries):
+        response = session.get(url, params=params, timeout=30)
+        # Rate limits and gateway errors are usually transient, so retry them
+        if response.status_code == 429 or response.status_code >= 500:
+            try:
+                delay = int(response.headers.get("Retry-After", RETRY_DELAY))
+            except ValueError:
+                delay = RETRY_DELAY  # Retry-After can also be an HTTP date
+            logger.debug(f"Fetching {path} returned {response.status_code}, retrying in {delay}s")
+            if attempt + 1 < retries:
+                sleep(delay)
+            continue
+        response.raise_for_status()
+        return response.json()
+    raise RuntimeError(f"Failed to fetch {path} after {retries} attempts, last status code: {response.status_code}.")
+
+def fetch_paged(session, path, params):
+    """Yield every result of a paged Confluence listing."""
+    start = 0
+    while True:
+        data = api_get(session, path, dict(params, start=start, limit=PAGE_LIMIT))
+        results = data.get("results", [])
+        yield from results
+        if not results or "next" not in data.get("_links", {}):
+            return
+        start += len(results)
+
+def count_attachments(session, page):
+    attachments = page.get("children", {}).get("attachment", {})
+    if "next" not in attachments.get("_links", {}):
+        return attachments.get("size", 0)
+    # More attachments than fit in the expansion, so page through them
+    return sum(1 for _ in fetch_paged(session, f"/{page['id']}/child/attachment", {}))
+
+def summarize_page(session, page):
+    """Reduce a page from the REST API to the fields that are compared."""
+    return {
+        "id": page["id"],
+        "title": page["title"],
+        "version": page.get("version", {}).get("number"),
+        "updated": page.get("version", {}).get("when"),
+        "labels": sorted(label["name"] for label in page.get("metadata", {}).get("labels", {}).get("results", [])),
+        "attachments": count_attachments(session, page)
+    }
+
+def fetch_page(session, page_id):
+    return summarize_page(session, api_get(session, f"/{page_id}", {"expand": PAGE_EXPAND}))
+
+def fetch_child_pages(session, page_id):
+    children = fetch_paged(session, f"/{page_id}/child/page", {"expand": PAGE_EXPAND})
+    return [summarize_page(session, child) for child in children]
+
+def _parse_time(value):
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+def compare_pages(source, destination, prefix, path):
+    """Return the differences between a source page and its copy."""
+    differences = []
+
+    def add(issue, source_value, destination_value):
+        differences.append({"path": path, "issue": issue, "source": source_value, "destination": destination_value})
+
+    if destination["title"] != f"{prefix}{source['title']}":
+        add("title", f"{prefix}{source['title']}", destination["title"])
+    if source["labels"] != destination["labels"]:
+        add("labels", source["labels"], destination["labels"])
+    if source["attachments"] != destination["attachments"]:
+        add("attachments", source["attachments"], destination["attachments"])
+
+    # A copy always starts at version 1, so compare edit times to spot sources changed since the copy
+    source_updated, destination_updated = _parse_time(source["updated"]), _parse_time(destination["updated"])
+    if source_updated and destination_updated and source_updated > destination_updated:
+        add("version", f"v{source['version']} at {source['updated']}", f"v{destination['version']} at {destination['updated']}")
+    return differences
+
+def fetch_batch(session, executor, calls):
+    """Run (fetch, page_id) calls concurrently, returning each result, or the exception it raised, by call."""
+    futures = {call: executor.submit(call[0], session, call[1]) for call in dict.fromkeys(calls)}
+    results = {}
+    for call, future in futures.items():
+        try:
+            results[call] = future.result()
+        except Exception as e:
+            results[call] = e
+    return results
+
+def _fail(report, error):
+    if "error" not in report:
+        logger.error(f"Error verifying copy from {report['from']} to {report['to']}: {error}")
+        report["error"] = str(error)
+
+def verify_operations(operations, max_workers=8):
+    """Verify a list of copy operations ({"from", "to", "prefix"} dicts) and return one report per operation.
+
+    Source trees and their copies are walked level by level, and the pages on the
+    current level of every operation are fetched together in one concurrent batch,
+    so a manifest of many small copies takes about as many rounds as its deepest tree.
+    """
+    session = create_session()
+    reports = [{
+        "from": operation["from"],
+        "to": operation["to"],
+        "prefix": operation["prefix"] or "",
+        "title": None,
+        "copied_page_id": None,
+        "source_pages": 0,
+        "destination_pages": 0,
+        "differences": []
+    } for operation in operations]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # The copy of each source page is the child of the destination page with the prefixed title
+        roots = fetch_batch(session, executor, [call for report in reports for call in
+                                                ((fetch_page, report["from"]), (fetch_child_pages, report["to"]))])
+
+        # Each entry pairs a source page with its copy; either side is None when the other has no match
+        level = []
+        for report in reports:
+            source_root, destination_siblings = roots[(fetch_page, report["from"])], roots[(fetch_child_pages, report["to"])]
+            if isinstance(source_root, Exception) or isinstance(destination_siblings, Exception):
+                _fail(report, source_root if isinstance(source_root, Exception) else destination_siblings)
+                continue
+            report["title"] = source_root["title"]
+            # With no prefix the source itself may sit under `to` with the expected title; it is not its own copy
+            destination_root = next((page for page in destination_siblings
+                                     if page["title"] == f"{report['prefix']}{source_root['title']}"
+                                     and page["id"] != source_root["id"]), None)
+            if destination_root:
+                report["copied_page_id"] = destination_root["id"]
+            level.append((report, source_root, destination_root, source_root["title"]))
+
+        while level:
+            for report, source, destination, path in level:
+                report["source_pages"] += source is not None
+                report["destination_pages"] += destination is not None
+                if source and destination:
+                    report["differences"].extend(compare_pages(source, destination, report["prefix"], path))
+                elif source:
+                    report["differences"].append({"path": path, "issue": "missing", "source": source["id"], "destination": None})
+                else:
+                    report["differences"].append({"path": path, "issue": "unexpected", "source": None, "destination": destination["id"]})
+
+            # Fetch the children of every page on this level, across all operations and both sides, in one batch
+            children = fetch_batch(session, executor, [(fetch_child_pages, page["id"])
+                                                       for _, source, destination, _ in level
+                                                       for page in (source, destination) if page])
+
+            next_level = []
+            for report, source, destination, path in level:
+                source_children = children[(fetch_child_pages, source["id"])] if source else []
+                destination_children = children[(fetch_child_pages, destination["id"])] if destination else []
+                if isinstance(source_children, Exception) or isinstance(destination_children, Exception):
+                    _fail(report, source_children if isinstance(source_children, Exception) else destination_children)
+                    continue
+                source_ids = {child["id"] for child in source_children}
+                destination_by_title = {page["title"]: page for page in destination_children if page["id"] not in source_ids}
+                for child in source_children:
+                    copy = destination_by_title.pop(f"{report['prefix']}{child['title']}", None)
+                    next_level.append((report, child, copy, f"{path} / {child['title']}"))
+                for copy in destination_by_title.values():
+                    next_level.append((report, None, copy, f"{path} / {copy['title']}"))
+            # Stop walking operations that hit an error on this level
+            level = [entry for entry in next_level if "error" not in entry[0]]
+
+    for report in reports:
+        if "error" not in report and report["source_pages"] != report["destination_pages"]:
+            report["differences"].insert(0, {"path": report["title"], "issue": "page_count",
+                                             "source": report["source_pages"], "destination": report["destination_pages"]})
+        report["ok"] = "error" not in report and not report["differences"]
+        if report["ok"]:
+            logger.info(f"Verified copy from {report['from']} to {report['to']}: {report['source_pages']} pages match.")
+        elif "error" not in report:
+            logger.warning(f"Copy from {report['from']} to {report['to']} has {len(report['differences'])} differences.")
+    return reports
+
+def write_report(reports, file_path=REPORT_FILE_PATH):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, mode="w") as file:
+        json.dump(reports, file, indent=2)
+    logger.info(f"Verification report written to {file_path}.")
+
+if __name__ == "__main__":
+    from main import deduplicate_operations, read_csv_to_dict
+
+    operations_file = sys.argv[1] if len(sys.argv) > 1 else "data/copy_operations.csv"
+    results = verify_operations(deduplicate_operations(read_csv_to_dict(operations_file)))
+    write_report(results)
+    sys.exit(0 if all(report["ok"] for report in results) else 1)
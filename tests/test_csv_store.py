@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+
+from modules.csv_store import CsvStore, HomepagesStore, homepages_store, operations_store, table_store
+
+@pytest.fixture
+def operations_file(tmp_path):
+    # Same shape as the shipped data/copy_operations.csv: header only, no trailing newline
+    path = tmp_path / "copy_operations.csv"
+    path.write_text("from,to,prefix", encoding="utf-8")
+    return str(path)
+
+@pytest.fixture
+def homepages_file(tmp_path):
+    path = tmp_path / "homepages.csv"
+    path.write_text("homepage_id,protected\n721348,True", encoding="utf-8")
+    return str(path)
+
+def test_append_to_file_without_trailing_newline(operations_file):
+    store = operations_store(operations_file)
+    store.append({"from": "1", "to": "2", "prefix": "Copy, "})
+    store.append({"from": "3", "to": "2", "prefix": None})
+
+    with open(operations_file, encoding="utf-8") as file:
+        assert file.read() == 'from,to,prefix\n1,2,"Copy, "\n3,2,\n'
+    assert ("1", "2") in store
+    assert CsvStore(operations_file).rows() == [
+        {"from": "1", "to": "2", "prefix": "Copy, "},
+        {"from": "3", "to": "2", "prefix": ""},
+    ]
+
+def test_append_round_trips_non_ascii_as_utf8(operations_file):
+    operations_store(operations_file).append({"from": "1", "to": "2", "prefix": "Größe – "})
+
+    with open(operations_file, "rb") as file:
+        assert "Größe – ".encode("utf-8") in file.read()
+    assert CsvStore(operations_file).rows()[0]["prefix"] == "Größe – "
+
+def test_add_rejects_duplicate_key(homepages_file):
+    store = homepages_store(homepages_file)
+
+    assert store.add({"homepage_id": "5", "protected": False})
+    assert not store.add({"homepage_id": "5", "protected": True})
+    assert not store.add({"homepage_id": "721348", "protected": False})
+    assert store.keys() == ["721348", "5"]
+    assert not store.is_protected("5")
+
+def test_remove_is_seen_by_another_instance(homepages_file):
+    table = table_store(homepages_file)
+    assert [row["homepage_id"] for row in table.rows()] == ["721348"]
+
+    homepages = homepages_store(homepages_file)
+    homepages.add({"homepage_id": "5", "protected": False})
+    assert homepages.remove("721348")
+    assert not homepages.remove("721348")
+
+    assert table.rows() == [{"homepage_id": "5", "protected": "False"}]
+
+def test_protected_ids_after_rewrite(homepages_file):
+    store = homepages_store(homepages_file)
+    assert store.protected_ids() == {"721348"}
+
+    store.write([{"homepage_id": "721348", "protected": "False"}, {"homepage_id": "9", "protected": "true"}])
+    assert store.protected_ids() == {"9"}
+
+    # A rewrite through a different instance invalidates the cached index
+    HomepagesStore(homepages_file).write([{"homepage_id": "10", "protected": "TRUE"}])
+    assert store.protected_ids() == {"10"}
+    assert not store.is_protected("9")
+
+def test_locked_is_reentrant(homepages_file):
+    store = HomepagesStore(homepages_file)
+    result = []
+
+    def nested():
+        with store.locked(exclusive=True):
+            result.append(store.get("721348"))
+            store.add({"homepage_id": "5", "protected": False})
+
+    thread = threading.Thread(target=nested, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive(), "nested locked() call deadlocked"
+    assert result == [{"homepage_id": "721348", "protected": "True"}]
+    assert "5" in store
+
+def test_locked_refuses_to_upgrade_shared_lock(homepages_file):
+    store = HomepagesStore(homepages_file)
+    with store.locked():
+        with pytest.raises(RuntimeError):
+            store.add({"homepage_id": "5", "protected": False})
+
+def test_write_homepages_keeps_protected_flags(homepages_file):
+    from modules.hompage_id_module import write_homepages
+
+    write_homepages(homepages_file, ["5", "721348", "5", ""])
+    store = homepages_store(homepages_file)
+    assert store.keys() == ["5", "721348"]
+    assert store.protected_ids() == {"721348"}
@@ -0,0 +1,119 @@
+import threading
+
+import pytest
+
+import modules.verify_module as verify_module
+
+# page ID -> (title, child page IDs)
+PAGES = {
+    "1": ("A", ["2", "3"]), "2": ("B", []), "3": ("C", ["4"]), "4": ("D", []),
+    "20": ("E", []),
+    "10": ("Destination", ["11", "21"]),
+    "11": ("Copy of A", ["12", "13"]), "12": ("Copy of B", []), "13": ("Copy of C", []),
+    "21": ("Copy of E", []),
+    "30": ("Parent", ["31"]), "31": ("F", ["32"]), "32": ("G", []),
+}
+
+def _page(page_id):
+    return {
+        "id": page_id,
+        "title": PAGES[page_id][0],
+        "version": {"number": 1, "when": "2026-01-01T00:00:00Z"},
+        "metadata": {"labels": {"results": []}},
+        "children": {"attachment": {"size": 0, "_links": {}}},
+    }
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    calls = []
+    lock = threading.Lock()
+
+    def api_get(session, path, params=None):
+        with lock:
+            calls.append(path)
+        page_id, *rest = path.strip("/").split("/")
+        if page_id not in PAGES:
+            raise RuntimeError(f"page {page_id} not found")
+        if not rest:
+            return _page(page_id)
+        return {"results": [_page(child) for child in PAGES[page_id][1]], "_links": {}}
+
+    monkeypatch.setattr(verify_module, "create_session", lambda: None)
+    monkeypatch.setattr(verify_module, "api_get", api_get)
+    return calls
+
+def test_reports_each_operation(fake_api):
+    reports = verify_module.verify_operations([
+        {"from": "1", "to": "10", "prefix": "Copy of "},
+        {"from": "20", "to": "10", "prefix": "Copy of "},
+        {"from": "99", "to": "10", "prefix": "Copy of "},
+    ])
+
+    missing, matching, failed = reports
+    assert not missing["ok"]
+    assert (missing["source_pages"], missing["destination_pages"]) == (4, 3)
+    assert [(d["issue"], d["path"]) for d in missing["differences"]] == [("page_count", "A"), ("missing", "A / C / D")]
+
+    assert matching["ok"]
+    assert matching["copied_page_id"] == "21"
+
+    assert not failed["ok"]
+    assert "page 99 not found" in failed["error"]
+
+def test_source_is_not_mistaken_for_its_own_copy(fake_api):
+    # With no prefix, a copy into the source's own parent conflicts and is never made
+    report, = verify_module.verify_operations([{"from": "31", "to": "30", "prefix": ""}])
+
+    assert not report["ok"]
+    assert report["copied_page_id"] is None
+    assert (report["source_pages"], report["destination_pages"]) == (2, 0)
+    assert [(d["issue"], d["path"]) for d in report["differences"]] == [
+        ("page_count", "F"), ("missing", "F"), ("missing", "F / G")]
+
+def test_destination_children_are_fetched_once_per_level(fake_api):
+    verify_module.verify_operations([
+        {"from": "1", "to": "10", "prefix": "Copy of "},
+        {"from": "20", "to": "10", "prefix": "Copy of "},
+    ])
+    # Both operations share the destination parent, so its children are only listed once
+    assert fake_api.count("/10/child/page") == 1
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None, data=None):
+        self.status_code, self.headers, self.data = status_code, headers or {}, data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def json(self):
+        return self.data
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def get(self, url, params=None, timeout=None):
+        return self.responses.pop(0)
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays = []
+    monkeypatch.setattr(verify_module, "sleep", delays.append)
+    monkeypatch.setattr(verify_module, "get_settings", lambda: type("Settings", (), {"api_base_url": "https://wiki"})())
+    return delays
+
+def test_api_get_retries_server_errors_and_http_date_retry_after(no_sleep):
+    session = FakeSession([
+        FakeResponse(502),
+        FakeResponse(429, {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}),
+        FakeResponse(200, data={"id": "1"}),
+    ])
+    assert verify_module.api_get(session, "/1") == {"id": "1"}
+    assert no_sleep == [verify_module.RETRY_DELAY, verify_module.RETRY_DELAY]
+
+def test_api_get_gives_up_after_retries(no_sleep):
+    session = FakeSession([FakeResponse(503, {"Retry-After": "2"})] * 3)
+    with pytest.raises(RuntimeError, match="503"):
+        verify_module.api_get(session, "/1")
+    assert no_sleep == [2, 2]